@@ -1,9 +1,13 @@
 """Explainers.countefactual module"""
 # pylint: disable = import-error, too-few-public-methods, wrong-import-order, line-too-long,
-# pylint: disable = unused-argument
-from typing import Optional, Union, List
-import matplotlib.pyplot as plt
-import matplotlib as mpl
+# pylint: disable = unused-argument, import-outside-toplevel
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from itertools import compress
+from numbers import Real
+from threading import Lock
+from typing import Any, Dict, Optional, Union, List, Tuple
+import numpy as np
 import pandas as pd
 import uuid as _uuid
 
@@ -44,11 +48,63 @@ from org.kie.trustyai.explainability.model import (
 from org.kie.trustyai.explainability.model.domain import FeatureDomain
 
 from org.optaplanner.core.config.solver.termination import TerminationConfig
-from java.lang import Long
+from jpype import JLong
 
 SolverConfigBuilder = _SolverConfigBuilder
 CounterfactualConfig = _CounterfactualConfig
 
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool that waits on asynchronous counterfactual searches"""
+    global _EXECUTOR  # pylint: disable=global-statement
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(thread_name_prefix="trustyai-counterfactual")
+    return _EXECUTOR
+
+
+def _solver_config(steps: int):
+    """Build a new solver configuration for this step budget. The Java explainer writes each
+    search's timeout onto its solver configuration, so configurations are never shared"""
+    termination_config = TerminationConfig().withScoreCalculationCountLimit(
+        JLong(steps)
+    )
+    return (
+        SolverConfigBuilder.builder().withTerminationConfig(termination_config).build()
+    )
+
+
+def _numeric_differences(proposed: List, original: List) -> np.ndarray:
+    """Return the element-wise difference between the proposed and original values as a
+    float array, with NaN wherever either value is not numeric"""
+    numeric = np.fromiter(
+        (
+            isinstance(p, Real)
+            and isinstance(o, Real)
+            and not isinstance(p, bool)
+            and not isinstance(o, bool)
+            for p, o in zip(proposed, original)
+        ),
+        dtype=bool,
+        count=len(proposed),
+    )
+    differences = np.full(len(proposed), np.nan)
+    differences[numeric] = np.fromiter(
+        compress(proposed, numeric), dtype=np.float64
+    ) - np.fromiter(compress(original, numeric), dtype=np.float64)
+    return differences
+
+
+def _values_array(values: List) -> np.ndarray:
+    """Convert feature values to a float array if they are all numeric, otherwise to an
+    object array"""
+    if all(isinstance(v, Real) and not isinstance(v, bool) for v in values):
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    return np.array(values, dtype=object)
+
 
 class CounterfactualResult(ExplanationResults):
     """Wraps Counterfactual results. This object is returned by the
@@ -61,23 +117,47 @@ class CounterfactualResult(ExplanationResults):
         used manually."""
         self._result = result
 
+    @cached_property
+    def _proposed_features(self):
+        """The proposed features, converted once from the counterfactual entities"""
+        return [entity.as_feature() for entity in self._result.entities]
+
+    @cached_property
+    def _proposed_input(self) -> PredictionInput:
+        """The proposed features as a single :class:`PredictionInput`, so the feature list is
+        only marshalled into Java once"""
+        return PredictionInput(self._proposed_features)
+
     @property
     def proposed_features_array(self):
         """Return the proposed feature values found from the counterfactual explanation
         as a Numpy array.
         """
-        return prediction_object_to_numpy(
-            [PredictionInput([entity.as_feature() for entity in self._result.entities])]
-        )
+        return self._proposed_features_array.copy()
 
     @property
     def proposed_features_dataframe(self):
         """Return the proposed feature values found from the counterfactual explanation
         as a Pandas DataFrame.
         """
-        return prediction_object_to_pandas(
-            [PredictionInput([entity.as_feature() for entity in self._result.entities])]
-        )
+        return self._proposed_features_dataframe.copy()
+
+    @cached_property
+    def _proposed_features_array(self):
+        """The proposed feature values as a Numpy array, built on first access"""
+        proposed = self._entity_columns[1]
+        if all(isinstance(value, float) for value in proposed):
+            # all-float proposals fill a contiguous float64 buffer directly from the values
+            # already collected, without walking the Java features again
+            return np.fromiter(proposed, dtype=np.float64, count=len(proposed)).reshape(
+                1, -1
+            )
+        return prediction_object_to_numpy([self._proposed_input])
+
+    @cached_property
+    def _proposed_features_dataframe(self):
+        """The proposed feature values as a Pandas DataFrame, built on first access"""
+        return prediction_object_to_pandas([self._proposed_input])
 
     def as_dataframe(self) -> pd.DataFrame:
         """
@@ -93,22 +173,88 @@ class CounterfactualResult(ExplanationResults):
             * ``Proposed``: The found values of the features.
             * ``Original``: The original feature values.
             * ``Constrained``: Whether this feature was constrained (held fixed) during the search.
-            * ``Difference``: The difference between the proposed and original values.
+            * ``Difference``: The difference between the proposed and original values, or
+              ``NaN`` for non-numeric features.
         """
-        entities = self._result.entities
-        features = self._result.getFeatures()
+        return self._dataframe.copy()
+
+    @cached_property
+    def _dataframe(self) -> pd.DataFrame:
+        """The counterfactual dataframe, built on first access. The frame is shared and must
+        not be modified."""
+        names, proposed, original, constrained = self._entity_columns
+        return pd.DataFrame(
+            {
+                "features": names,
+                "proposed": proposed,
+                "original": original,
+                "constrained": constrained,
+                "difference": _numeric_differences(proposed, original),
+            }
+        )
 
-        data = {}
-        data["features"] = [f"{entity.as_feature().getName()}" for entity in entities]
-        data["proposed"] = [entity.as_feature().value.as_obj() for entity in entities]
-        data["original"] = [
-            feature.getValue().getUnderlyingObject() for feature in features
-        ]
-        data["constrained"] = [feature.is_constrained for feature in features]
+    @cached_property
+    def _entity_columns(self):
+        """Collect the feature names, proposed values, original values and constraints of
+        the counterfactual in a single pass over the Java entities and features"""
+        names, proposed, original, constrained = [], [], [], []
+        for proposed_feature, feature in zip(
+            self._proposed_features, self._result.getFeatures()
+        ):
+            names.append(f"{proposed_feature.getName()}")
+            proposed.append(proposed_feature.value.as_obj())
+            original.append(feature.getValue().getUnderlyingObject())
+            constrained.append(feature.is_constrained)
+        return names, proposed, original, constrained
+
+    def as_arrays(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the counterfactual result as NumPy arrays, without building a DataFrame.
 
-        dfr = pd.DataFrame.from_dict(data)
-        dfr["difference"] = dfr.proposed - dfr.original
-        return dfr
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            The ``features``, ``proposed``, ``original``, ``constrained`` and ``difference``
+            columns of :func:`as_dataframe`, in that order. The ``proposed`` and ``original``
+            arrays are ``float64`` when every value is numeric, and ``object`` otherwise.
+        """
+        names, proposed, original, constrained = self._entity_columns
+        return (
+            np.array(names, dtype=object),
+            _values_array(proposed),
+            _values_array(original),
+            np.array(constrained, dtype=bool),
+            _numeric_differences(proposed, original),
+        )
+
+    def as_records(self) -> List[Dict[str, Any]]:
+        """
+        Return the counterfactual result as a list of records, without building a DataFrame.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One dictionary per feature, keyed by the column names of :func:`as_dataframe`.
+        """
+        names, proposed, original, constrained = self._entity_columns
+        return [
+            {
+                "features": name,
+                "proposed": proposed_value,
+                "original": original_value,
+                "constrained": is_constrained,
+                "difference": difference,
+            }
+            for name, proposed_value, original_value, is_constrained, difference in zip(
+                names,
+                proposed,
+                original,
+                constrained,
+                _numeric_differences(proposed, original).tolist(),
+            )
+        ]
 
     def as_html(self) -> pd.io.formats.style.Styler:
         """
@@ -127,21 +273,23 @@ class CounterfactualResult(ExplanationResults):
         """
         Plot the counterfactual result.
         """
-        _df = self.as_dataframe().copy()
-        _df = _df[_df["difference"] != 0.0]
-
-        def change_colour(value):
-            if value == 0.0:
-                colour = ds["neutral_primary_colour"]
-            elif value > 0:
-                colour = ds["positive_primary_colour"]
-            else:
-                colour = ds["negative_primary_colour"]
-            return colour
+        import matplotlib.pyplot as plt
+        import matplotlib as mpl
+
+        dfr = self._dataframe
+        difference = dfr["difference"].to_numpy()
+        changed = (difference != 0.0) & ~np.isnan(difference)
+        # boolean indexing already copies, so the shared cached frame is never modified
+        _df = dfr.loc[changed, ["features", "proposed", "original"]]
+        difference = difference[changed]
+        colour = np.select(
+            [difference > 0, difference < 0],
+            [ds["positive_primary_colour"], ds["negative_primary_colour"]],
+            default=ds["neutral_primary_colour"],
+        )
 
         with mpl.rc_context(drcp):
-            colour = _df["difference"].transform(change_colour)
-            plot = _df[["features", "proposed", "original"]].plot.barh(
+            plot = _df.plot.barh(
                 x="features", color={"proposed": colour, "original": "black"}
             )
             plot.set_title("Counterfactual")
@@ -168,17 +316,11 @@ class CounterfactualExplainer:
         steps: int
             The number of search steps to perform during the counterfactual search.
         """
-        self._termination_config = TerminationConfig().withScoreCalculationCountLimit(
-            Long.valueOf(steps)
-        )
-        self._solver_config = (
-            SolverConfigBuilder.builder()
-            .withTerminationConfig(self._termination_config)
-            .build()
+        self._steps = steps
+        self._solver_config = _solver_config(steps)
+        self._explainer = _CounterfactualExplainer(
+            CounterfactualConfig().withSolverConfig(self._solver_config)
         )
-        self._cf_config = CounterfactualConfig().withSolverConfig(self._solver_config)
-
-        self._explainer = _CounterfactualExplainer(self._cf_config)
 
     # pylint: disable=too-many-arguments
     @data_conversion_docstring("one_input", "one_output")
@@ -228,12 +370,121 @@ class CounterfactualExplainer:
         :class:`~CounterfactualResult`
             Object containing the results of the counterfactual explanation.
         """
+        _prediction = self._counterfactual_prediction(
+            inputs,
+            model,
+            goal,
+            feature_domains,
+            data_distribution,
+            uuid,
+            timeout,
+            criteria,
+        )
+        with Model.NonArrowTransmission(model):
+            return CounterfactualResult(
+                self._explainer.explainAsync(_prediction, model).get()
+            )
+
+    # pylint: disable=too-many-arguments
+    @data_conversion_docstring("one_input", "one_output")
+    def explain_async(
+        self,
+        inputs: OneInputUnionType,
+        model: Union[PredictionProvider, Model],
+        goal: Optional[OneOutputUnionType] = None,
+        feature_domains: List[FeatureDomain] = None,
+        data_distribution: Optional[DataDistribution] = None,
+        uuid: Optional[_uuid.UUID] = None,
+        timeout: Optional[float] = None,
+        criteria: Optional[GoalCriteria] = None,
+    ) -> Future:
+        r"""Request a counterfactual explanation without blocking the calling thread. This
+        accepts the same arguments as :func:`explain`, but returns as soon as the search has
+        been submitted, allowing several independent searches to run concurrently.
+        The transmission mode of a :class:`~trustyai.model.Model` is not changed, so it can
+        be shared with other explainers while the search runs, but its ``fn`` must be safe
+        to call from multiple threads.
+
+        Parameters
+        ----------
+        inputs : {}
+            List of input features, as a: {}
+        goal : {}
+            The desired model outputs to be searched for in the counterfactual explanation.
+            These can take the form of a: {}
+        model : :obj:`~trustyai.model.PredictionProvider`
+            The TrustyAI model as generated by :class:`~trustyai.model.Model` or a Java :class:`PredictionProvider`
+        feature_domains : List[:class:`FeatureDomain`]
+            A list of feature domains (each created by :func:`~trustyai.model.feature_domain()`)
+            that define the valid domain of the input features. The ith element of the list defines
+            the domain of the ith input feature. If the ith element of this list is ``None``, the
+            no domain information will be added to the ith feature. If the ith feature had no
+            previously-supplied domain information, it will be taken to be constrained and
+            non-variable. If ``feature_domains=None``, no domain information will be added to any
+            of the features, thus preserving existing domains if they've been manually added
+            previously or holding undomained features constrained.
+        data_distribution : Optional[:class:`DataDistribution`]
+            The :class:`DataDistribution` to use when sampling the inputs.
+        uuid : Optional[:class:`_uuid.UUID`]
+            The UUID to use during search.
+        timeout : Optional[float]
+            The timeout time in seconds of the counterfactual explanation.
+        criteria : Optional[:class:`GoalCriteria`]
+            An optional custom scoring function, wrapped as a :class:`GoalCriteria`.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future resolving to the :class:`~CounterfactualResult` of the search.
+        """
+        _prediction = self._counterfactual_prediction(
+            inputs,
+            model,
+            goal,
+            feature_domains,
+            data_distribution,
+            uuid,
+            timeout,
+            criteria,
+        )
+        # the search gets its own Java explainer, so concurrent timeouts never meet on one
+        # solver configuration, and calls the model's non-arrow provider directly rather
+        # than swapping its transmission mode, which other threads may be using
+        explainer = _CounterfactualExplainer(
+            CounterfactualConfig().withSolverConfig(_solver_config(self._steps))
+        )
+        if isinstance(model, Model):
+            provider = model.prediction_provider_normal
+        else:
+            provider = model
+
+        def _search():
+            return CounterfactualResult(
+                explainer.explainAsync(_prediction, provider).get()
+            )
+
+        return _get_executor().submit(_search)
+
+    # pylint: disable=too-many-arguments
+    @staticmethod
+    def _counterfactual_prediction(
+        inputs: OneInputUnionType,
+        model: Union[PredictionProvider, Model],
+        goal: Optional[OneOutputUnionType],
+        feature_domains: Optional[List[FeatureDomain]],
+        data_distribution: Optional[DataDistribution],
+        uuid: Optional[_uuid.UUID],
+        timeout: Optional[float],
+        criteria: Optional[GoalCriteria],
+    ):
+        """Build the Java counterfactual prediction shared by :func:`explain` and
+        :func:`explain_async`"""
         feature_names = model.feature_names if isinstance(model, Model) else None
         output_names = model.output_names if isinstance(model, Model) else None
         if goal is None and criteria is None:
             raise ValueError("Either a goal or criteria must be provided.")
 
-        _prediction = counterfactual_prediction(
+        return counterfactual_prediction(
             input_features=one_input_convert(
                 inputs, feature_names=feature_names, feature_domains=feature_domains
             ),
@@ -245,8 +496,3 @@ class CounterfactualExplainer:
             timeout=timeout,
             criteria=criteria,
         )
-
-        with Model.NonArrowTransmission(model):
-            return CounterfactualResult(
-                self._explainer.explainAsync(_prediction, model).get()
-            )
@@ -1,5 +1,6 @@
 """Generic class for Explanation and Saliency results"""
 from abc import ABC, abstractmethod
+from functools import cached_property
 
 import pandas as pd
 from pandas.io.formats.style import Styler
@@ -19,8 +20,14 @@ class ExplanationResults(ABC):
 
 # pylint: disable=too-few-public-methods
 class SaliencyResults(ExplanationResults):
-    """Abstract class for saliency visualisers"""
+    """Abstract class for saliency visualisers. The saliencies wrapped by a results object
+    are treated as immutable, so subclasses must not modify them after construction."""
 
     @abstractmethod
     def saliency_map(self):
         """Return the Saliencies as a dictionary, keyed by output name"""
+
+    @cached_property
+    def _saliency_map_cached(self):
+        """The saliency map, computed once and shared by the visualizations"""
+        return self.saliency_map()
@@ -5,10 +5,9 @@ from typing import Dict, Union
 
 import numpy as np
 import pandas as pd
-from matplotlib.colors import LinearSegmentedColormap
 
 from trustyai import _default_initializer  # pylint: disable=unused-import
-from trustyai.utils._visualisation import DEFAULT_STYLE as ds
+from trustyai.utils._visualisation import saliency_colormap
 from trustyai.utils.data_conversions import (
     OneInputUnionType,
     data_conversion_docstring,
@@ -76,12 +75,10 @@ class LimeResults(SaliencyResults):
             * ``Confidence``: The confidence of this explanation as returned by the explainer.
 
         """
-        outputs = self.saliency_map().keys()
-
         data = {}
-        for output in outputs:
+        for output, saliency in self._saliency_map_cached.items():
             output_rows = []
-            for pfi in self.saliency_map().get(output).getPerFeatureImportance():
+            for pfi in saliency.getPerFeatureImportance():
                 output_rows.append(
                     {
                         "Feature": str(pfi.getFeature().getName().toString()),
@@ -110,14 +107,7 @@ class LimeResults(SaliencyResults):
         htmls = {}
         for k, df in self.as_dataframe().items():
             htmls[k] = df.style.background_gradient(
-                LinearSegmentedColormap.from_list(
-                    name="rwg",
-                    colors=[
-                        ds["negative_primary_colour"],
-                        ds["neutral_primary_colour"],
-                        ds["positive_primary_colour"],
-                    ],
-                ),
+                saliency_colormap(),
                 subset="Saliency",
                 vmin=-1 * max(np.abs(df["Saliency"])),
                 vmax=max(np.abs(df["Saliency"])),
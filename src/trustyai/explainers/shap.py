@@ -1,14 +1,15 @@
 """Explainers.shap module"""
 # pylint: disable = import-error, too-few-public-methods, wrong-import-order, line-too-long,
 # pylint: disable = unused-argument, consider-using-f-string, invalid-name
+import logging
+from functools import cached_property
 from typing import Dict, Optional, Union
-from matplotlib.colors import LinearSegmentedColormap
 import pandas as pd
 import numpy as np
 from jpype import JInt
 
 from trustyai import _default_initializer  # pylint: disable=unused-import
-from trustyai.utils._visualisation import DEFAULT_STYLE as ds
+from trustyai.utils._visualisation import DEFAULT_STYLE as ds, saliency_colormap
 from .explanation_results import SaliencyResults
 from trustyai.model import simple_prediction, Model
 from trustyai.utils.data_conversions import (
@@ -37,22 +38,64 @@ from org.kie.trustyai.explainability.model import (
     Saliency,
     PerturbationContext,
 )
-from java.util import Random
+from java.util import ArrayList, Random
 
 
 # pylint: disable=invalid-name
 
 
+def _mean_feature_values(background, raw_background=None) -> np.ndarray:
+    """The mean value of each feature across a converted background. If the raw background it
+    was converted from is purely numeric, the mean is taken from it directly rather than read
+    back from Java."""
+    if isinstance(raw_background, (np.ndarray, pd.DataFrame)):
+        raw_values = np.asarray(raw_background)
+        if raw_values.dtype.kind in "biuf":
+            return (
+                raw_values.reshape(len(background), -1).astype(np.float64).mean(axis=0)
+            )
+    values = np.fromiter(
+        (f.getValue().asNumber() for pi in background for f in pi.getFeatures()),
+        dtype=np.float64,
+    )
+    return values.reshape(len(background), -1).mean(axis=0)
+
+
+def _subsample_background(background, max_samples, seed):
+    """Randomly keep at most `max_samples` rows of a background, preserving their order"""
+    # a one-dimensional array is a single datapoint, so there's nothing to subsample
+    if isinstance(background, np.ndarray) and background.ndim == 1:
+        return background
+    n_rows = len(background)
+    if max_samples is None or n_rows <= max_samples:
+        return background
+    logging.info(
+        "Subsampling SHAP background from %d to %d datapoints", n_rows, max_samples
+    )
+    rows = np.sort(
+        np.random.default_rng(seed).choice(n_rows, size=max_samples, replace=False)
+    ).tolist()
+    if isinstance(background, np.ndarray):
+        return background[rows]
+    if isinstance(background, pd.DataFrame):
+        return background.iloc[rows]
+    return [background[i] for i in rows]
+
+
 class SHAPResults(SaliencyResults):
     """Wraps SHAP results. This object is returned by the :class:`~SHAPExplainer`,
     and provides a variety of methods to visualize and interact with the explanation.
     """
 
-    def __init__(self, saliency_results: SaliencyResults, background):
+    def __init__(
+        self, saliency_results: SaliencyResults, background, background_mean=None
+    ):
         """Constructor method. This is called internally, and shouldn't ever need to be used
         manually."""
         self._java_saliency_results = saliency_results
         self.background = background
+        self._given_background_mean = background_mean
+        self._feature_arrays = {}
 
     def saliency_map(self) -> Dict[str, Saliency]:
         """
@@ -63,9 +106,10 @@ class SHAPResults(SaliencyResults):
         Dict[str, Saliency]
              A dictionary of :class:`~trustyai.model.Saliency` objects, keyed by output name.
         """
+        saliencies = self._java_saliency_results.saliencies
         return {
-            entry.getKey(): entry.getValue()
-            for entry in self._java_saliency_results.saliencies.entrySet()
+            str(output_name): saliencies.get(output_name)
+            for output_name in saliencies.keySet()
         }
 
     def get_fnull(self):
@@ -78,39 +122,63 @@ class SHAPResults(SaliencyResults):
              An array of the y-intercepts, in order of the model outputs.
         """
         return {
-            output_name: saliency.getPerFeatureImportance()[-1].getScore()
-            for output_name, saliency in self.saliency_map().items()
+            output_name: self._extract(output_name)[4]
+            for output_name in self._saliency_map_cached
         }
 
-    def _saliency_to_dataframe(self, saliency, output_name):
-        background_mean_feature_values = np.mean(
-            [
-                [f.getValue().asNumber() for f in pi.getFeatures()]
-                for pi in self.background
-            ],
-            0,
-        ).tolist()
-
-        data_rows = []
-        for i, pfi in enumerate(saliency.getPerFeatureImportance()[:-1]):
-            data_rows.append(
-                {
-                    "Feature": str(pfi.getFeature().getName().toString()),
-                    "Value": pfi.getFeature().getValue().getUnderlyingObject(),
-                    "Mean Background Value": background_mean_feature_values[i],
-                    "SHAP Value": pfi.getScore(),
-                    "Confidence": pfi.getConfidence(),
-                }
+    @cached_property
+    def _background_mean(self) -> np.ndarray:
+        """The mean value of each feature across the background, shared by every output"""
+        if self._given_background_mean is not None:
+            return self._given_background_mean
+        return _mean_feature_values(self.background)
+
+    def _extract(self, output_name):
+        """Return the feature names, feature values, SHAP values, confidences and fnull of an
+        output, read from the Java saliency in a single pass and cached per output"""
+        if output_name not in self._feature_arrays:
+            pfis = self._saliency_map_cached[output_name].getPerFeatureImportance()
+            names, values = [], []
+            scores = np.empty(len(pfis) - 1)
+            confidences = np.empty(len(pfis) - 1)
+            for i, pfi in enumerate(pfis[:-1]):
+                feature = pfi.getFeature()
+                names.append(str(feature.getName()))
+                values.append(feature.getValue().getUnderlyingObject())
+                scores[i] = pfi.getScore()
+                confidences[i] = pfi.getConfidence()
+            self._feature_arrays[output_name] = (
+                names,
+                values,
+                scores,
+                confidences,
+                pfis[-1].getScore(),
             )
+        return self._feature_arrays[output_name]
 
-        fnull = {
-            "Feature": "Background",
-            "Value": None,
-            "Mean Background Value": None,
-            "SHAP Value": self.get_fnull()[output_name],
-        }
+    def _saliency_to_dataframe(self, output_name, fnull):
+        names, values, scores, confidences, _ = self._extract(output_name)
 
-        return pd.DataFrame([fnull] + data_rows)
+        return pd.DataFrame(
+            {
+                "Feature": ["Background"] + names,
+                "Value": [None] + values,
+                "Mean Background Value": np.concatenate(
+                    ([np.nan], self._background_mean)
+                ),
+                "SHAP Value": np.concatenate(([fnull], scores)),
+                "Confidence": np.concatenate(([np.nan], confidences)),
+            }
+        )
+
+    @cached_property
+    def _dataframes(self) -> Dict[str, pd.DataFrame]:
+        """The result dataframe of each output, built once and shared by :func:`as_dataframe`
+        and :func:`as_html`"""
+        return {
+            output_name: self._saliency_to_dataframe(output_name, fnull)
+            for output_name, fnull in self.get_fnull().items()
+        }
 
     def as_dataframe(self) -> Dict[str, pd.DataFrame]:
         """
@@ -129,10 +197,7 @@ class SHAPResults(SaliencyResults):
             * ``Confidence``: The confidence of this explanation as returned by the explainer.
 
         """
-        df_dict = {}
-        for output_name, saliency in self.saliency_map().items():
-            df_dict[output_name] = self._saliency_to_dataframe(saliency, output_name)
-        return df_dict
+        return {output_name: df.copy() for output_name, df in self._dataframes.items()}
 
     def as_html(self) -> Dict[str, pd.io.formats.style.Styler]:
         """
@@ -150,37 +215,36 @@ class SHAPResults(SaliencyResults):
             * Color each ``SHAP Value`` based on how their magnitude.
         """
 
+        below_css = f"background-color:{ds['negative_primary_colour']}"
+        above_css = f"background-color:{ds['positive_primary_colour']}"
+
         def _color_feature_values(feature_values, background_vals):
             """Internal function for the dataframe visualization"""
-            formats = []
-            for i, feature_value in enumerate(feature_values[1:]):
-                if feature_value < background_vals[i]:
-                    formats.append(f"background-color:{ds['negative_primary_colour']}")
-                elif feature_value > background_vals[i]:
-                    formats.append(f"background-color:{ds['positive_primary_colour']}")
-                else:
-                    formats.append(None)
-            return [None] + formats
+            feature_values = np.asarray(feature_values, dtype=np.float64)[1:]
+            background_vals = np.asarray(background_vals, dtype=np.float64)
+            formats = np.select(
+                [feature_values < background_vals, feature_values > background_vals],
+                [below_css, above_css],
+                default=None,
+            )
+            return [None] + formats.tolist()
 
         df_dict = {}
-        for output_name, saliency in self.saliency_map().items():
-            df = self._saliency_to_dataframe(saliency, output_name)
-            shap_values = df["SHAP Value"].values[1:]
+        for output_name, df in self.as_dataframe().items():
+            shap_extent = float(
+                np.abs(df["SHAP Value"].to_numpy()[1:]).max(initial=0.0)
+            )
             background_mean_feature_values = df["Mean Background Value"].values[1:]
 
-            style = df.style.background_gradient(
-                LinearSegmentedColormap.from_list(
-                    name="rwg",
-                    colors=[
-                        ds["negative_primary_colour"],
-                        ds["neutral_primary_colour"],
-                        ds["positive_primary_colour"],
-                    ],
-                ),
-                subset=(slice(1, None), "SHAP Value"),
-                vmin=-1 * max(np.abs(shap_values)),
-                vmax=max(np.abs(shap_values)),
-            )
+            # an all-zero output has no range to colour, so is left unstyled
+            style = df.style
+            if shap_extent > 0:
+                style = style.background_gradient(
+                    saliency_colormap(),
+                    subset=(slice(1, None), "SHAP Value"),
+                    vmin=-shap_extent,
+                    vmax=shap_extent,
+                )
             style.set_caption(f"Explanation of {output_name}")
             df_dict[output_name] = style.apply(
                 _color_feature_values,
@@ -217,9 +281,10 @@ class BackgroundGenerator:
             datapoints, feature_domains=feature_domains
         )
         self.feature_domains = feature_domains
-        self.seed = 0
+        self.seed = seed
         self._jrandom = Random()
         self._jrandom.setSeed(self.seed)
+        self._kmeans_backgrounds = {}
 
     def sample(self, k=100):
         r"""Randomly sample datapoints.
@@ -239,7 +304,8 @@ class BackgroundGenerator:
 
     def kmeans(self, k=100):
         r"""Use k-means clustering over `datapoints` and return k centroids as the background data
-        set.
+        set. The clustering is deterministic for a given `k` and seed, so results are cached and
+        repeated calls return a copy of the same centroids.
 
         Parameters
         ----------
@@ -251,7 +317,12 @@ class BackgroundGenerator:
         :list:`PredictionInput`
             The background dataset to pass to the :class:`~SHAPExplainer`
         """
-        return KMeansGenerator(self.datapoints, self.seed).generate(k)
+        key = (k, self.seed)
+        if key not in self._kmeans_backgrounds:
+            self._kmeans_backgrounds[key] = KMeansGenerator(
+                self.datapoints, self.seed
+            ).generate(k)
+        return ArrayList(self._kmeans_backgrounds[key])
 
     @data_conversion_docstring("many_outputs")
     def counterfactual(
@@ -342,7 +413,7 @@ class BackgroundGenerator:
         return background
 
 
-class SHAPExplainer:
+class SHAPExplainer:  # pylint: disable=too-many-instance-attributes
     r"""*"By how much did each feature contribute to the outputs?"*
 
     SHAP (`SHapley Additive exPlanations <https://arxiv.org/abs/1705.07874>`_) seeks to answer
@@ -401,6 +472,10 @@ class SHAPExplainer:
                 performance gains.
             * trackCounterfactuals : bool
                 (default= ``False``) Keep track of produced byproduct counterfactuals during SHAP run.
+            * max_background_samples: int
+                (default= ``None``) If set, backgrounds with more datapoints than this are randomly
+                subsampled down to this size, using `seed`, before being passed to the explainer.
+                This bounds the cost of each SHAP run for large backgrounds.
 
         Returns
         -------
@@ -409,27 +484,62 @@ class SHAPExplainer:
         """
         if not link_type:
             link_type = _ShapConfig.LinkType.IDENTITY
-        self._jrandom = Random()
-        self._jrandom.setSeed(kwargs.get("seed", 0))
-        self._raw_background = background
-        perturbation_context = PerturbationContext(self._jrandom, 0)
-
-        self._configbuilder = (
-            _ShapConfig.builder()
-            .withLink(link_type)
-            .withBatchSize(kwargs.get("batch_size", 20))
-            .withPC(perturbation_context)
-            .withTrackCounterfactuals(kwargs.get("track_counterfactuals", False))
+        jrandom = Random()
+        jrandom.setSeed(kwargs.get("seed", 0))
+        self._raw_background = _subsample_background(
+            background, kwargs.get("max_background_samples"), kwargs.get("seed", 0)
         )
-        if kwargs.get("samples") is not None:
-            self._configbuilder.withNSamples(JInt(kwargs["samples"]))
+        self._converted_backgrounds = {}
+        self._link_type = link_type
+        self._perturbation_context = PerturbationContext(jrandom, 0)
+        self._track_counterfactuals = kwargs.get("track_counterfactuals", False)
+        self._batch_size = kwargs.get("batch_size", 20)
+        self._samples = kwargs.get("samples")
+        self._explainers = {}
+
+    def _background(self, feature_names):
+        """Convert the background for the given feature names, along with its mean feature
+        values, reusing earlier conversions"""
+        key = None if feature_names is None else tuple(feature_names)
+        if key not in self._converted_backgrounds:
+            background = many_inputs_convert(self._raw_background, feature_names)
+            self._converted_backgrounds[key] = (
+                background,
+                _mean_feature_values(background, self._raw_background),
+            )
+        return self._converted_backgrounds[key]
+
+    def _explainer(self, feature_names, batch_size, samples):
+        """Return the Java SHAP explainer for a background and sampling configuration, building
+        it on first use"""
+        key = (
+            None if feature_names is None else tuple(feature_names),
+            batch_size,
+            samples,
+        )
+        if key not in self._explainers:
+            configbuilder = (
+                _ShapConfig.builder()
+                .withLink(self._link_type)
+                .withBatchSize(batch_size)
+                .withPC(self._perturbation_context)
+                .withTrackCounterfactuals(self._track_counterfactuals)
+                .withBackground(self._background(feature_names)[0])
+            )
+            if samples is not None:
+                configbuilder.withNSamples(JInt(samples))
+            self._explainers[key] = _ShapKernelExplainer(configbuilder.build())
+        return self._explainers[key]
 
+    # pylint: disable=too-many-arguments
     @data_conversion_docstring("one_input", "one_output")
     def explain(
         self,
         inputs: OneInputUnionType,
         outputs: OneOutputUnionType,
         model: Union[PredictionProvider, Model],
+        samples: Optional[int] = None,
+        batch_size: Optional[int] = None,
     ) -> SHAPResults:
         """Produce a SHAP explanation.
 
@@ -442,6 +552,12 @@ class SHAPExplainer:
             ``outputs = model(input_features)``. These can take the form of a: {}
         model : :obj:`~trustyai.model.PredictionProvider`
             The TrustyAI PredictionProvider, as generated by :class:`~trustyai.model.Model`
+        samples : int
+            (default= ``None``) Override the number of samples set in the constructor for this
+            explanation only.
+        batch_size : int
+            (default= ``None``) Override the batch size set in the constructor for this
+            explanation only.
 
         Returns
         -------
@@ -452,10 +568,13 @@ class SHAPExplainer:
         feature_names = model.feature_names if isinstance(model, Model) else None
         output_names = model.output_names if isinstance(model, Model) else None
         _prediction = simple_prediction(inputs, outputs, feature_names, output_names)
-        _background = many_inputs_convert(self._raw_background, feature_names)
-        config = self._configbuilder.withBackground(_background).build()
-        explainer = _ShapKernelExplainer(config)
+        explainer = self._explainer(
+            feature_names,
+            self._batch_size if batch_size is None else batch_size,
+            self._samples if samples is None else samples,
+        )
         with Model.ArrowTransmission(model, inputs):
             return SHAPResults(
-                explainer.explainAsync(_prediction, model).get(), _background
+                explainer.explainAsync(_prediction, model).get(),
+                *self._background(feature_names),
             )
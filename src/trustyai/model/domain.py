@@ -1,5 +1,6 @@
 # pylint: disable = import-error
 """Conversion method between Python and TrustyAI Java types"""
+from functools import lru_cache
 from typing import Optional, Tuple, List, Union
 
 from jpype import _jclass
@@ -14,6 +15,13 @@ from org.kie.trustyai.explainability.model.domain import (
 )
 
 
+@lru_cache(maxsize=1024)
+def _numerical_domain(lower: float, upper: float) -> NumericalFeatureDomain:
+    """Numerical domains are immutable, so identical ranges share one Java object. The cache
+    is bounded, since domains are often computed from data ranges"""
+    return NumericalFeatureDomain.create(lower, upper)
+
+
 def feature_domain(values: Optional[Union[Tuple, List]]) -> Optional[FeatureDomain]:
     r"""Create a Java :class:`FeatureDomain`. This represents the valid range of values for a
     particular feature, which is useful when constraining a counterfactual explanation to ensure it
@@ -57,7 +65,7 @@ def feature_domain(values: Optional[Union[Tuple, List]]) -> Optional[FeatureDoma
                 "Tuples passed as domain values must only contain"
                 " two values that define the (minimum, maximum) of the domain"
             )
-            domain = NumericalFeatureDomain.create(values[0], values[1])
+            domain = _numerical_domain(values[0], values[1])
 
         elif isinstance(values, list):
             java_array = _jclass.JClass("java.util.Arrays").asList(values)
@@ -1,5 +1,6 @@
 """Visualiser utilies for explainer results"""
-# pylint: disable = consider-using-f-string
+# pylint: disable = consider-using-f-string, import-outside-toplevel
+from functools import lru_cache
 
 
 # HTML FORMAT FUNCTIONS ============================================================================
@@ -65,3 +66,19 @@ DEFAULT_RC_PARAMS = {
     "figure.edgecolor": "777777",
     "savefig.bbox": "tight",
 }
+
+
+@lru_cache(maxsize=None)
+def saliency_colormap():
+    """The red-white-green colormap used to style saliency values in html tables, built once on
+    first use"""
+    from matplotlib.colors import LinearSegmentedColormap
+
+    return LinearSegmentedColormap.from_list(
+        name="rwg",
+        colors=[
+            DEFAULT_STYLE["negative_primary_colour"],
+            DEFAULT_STYLE["neutral_primary_colour"],
+            DEFAULT_STYLE["positive_primary_colour"],
+        ],
+    )
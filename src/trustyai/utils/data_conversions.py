@@ -7,8 +7,10 @@ from typing import Union, List, Optional, Tuple
 from itertools import filterfalse
 
 import trustyai.model
+from jpype import JString
 from org.kie.trustyai.explainability.model import (
     Feature,
+    FeatureFactory,
     Output,
     PredictionInput,
     PredictionOutput,
@@ -302,6 +304,19 @@ def many_outputs_convert(
 
 
 # === TrustyAI Conversions =========================================================================
+def _float_array_to_prediction_inputs(
+    array: np.ndarray, names: List[str]
+) -> List[PredictionInput]:
+    """Convert a 2D float64 array into a list of :class:`PredictionInput`, creating the numerical
+    features directly and reusing one Java string per feature name"""
+    java_names = [JString(name) for name in names]
+    factory = FeatureFactory.newNumericalFeature
+    return [
+        PredictionInput([factory(name, value) for name, value in zip(java_names, row)])
+        for row in array.tolist()
+    ]
+
+
 def df_to_prediction_object(
     df: pd.DataFrame, func
 ) -> Union[List[PredictionInput], List[PredictionOutput]]:
@@ -320,6 +335,10 @@ def df_to_prediction_object(
     """
     df = df.reset_index(drop=True)
     features_names = [str(x) for x in df.columns.values]
+    if func is trustyai.model.feature and all(
+        dtype == np.float64 for dtype in df.dtypes.values
+    ):
+        return _float_array_to_prediction_inputs(df.to_numpy(), features_names)
     rows = df.values.tolist()
     types = [trusty_type_map[t.kind] for t in df.dtypes.values]
     typed_rows = [zip(row, types, features_names) for row in rows]
@@ -365,6 +384,8 @@ def numpy_to_prediction_object(
         wrapper = PredictionOutput
     if names is None:
         names = [f"{prefix}-{i}" for i in range(shape[1])]
+    if wrapper is PredictionInput and array.dtype == np.float64:
+        return _float_array_to_prediction_inputs(array, names)
     types = [trusty_type_map[array[:, i].dtype.kind] for i in range(shape[1])]
     predictions = []
     for row_index in range(shape[0]):
@@ -61,7 +61,7 @@ def plot(
     elif isinstance(explanations, LevenshteinResult):
         viz.plot(explanations)
     elif output_name is None:
-        for output_name_iterator in explanations.saliency_map().keys():
+        for output_name_iterator in explanations._saliency_map_cached.keys():
             if render_bokeh:
                 show(viz._get_bokeh_plot(explanations, output_name_iterator))
             else:
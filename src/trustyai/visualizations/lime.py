@@ -1,5 +1,6 @@
 """Visualizations.lime module"""
 # pylint: disable = import-error, too-few-public-methods, consider-using-f-string, missing-final-newline
+# pylint: disable = protected-access
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 from bokeh.models import ColumnDataSource, HoverTool
@@ -14,7 +15,10 @@ from trustyai.utils._visualisation import (
     output_html,
     feature_html,
 )
-from trustyai.visualizations.visualization_results import VisualizationResults
+from trustyai.visualizations.visualization_results import (
+    VisualizationResults,
+    LazyBokehPlots,
+)
 
 
 class LimeViz(VisualizationResults):
@@ -26,9 +30,9 @@ class LimeViz(VisualizationResults):
         """Plot the LIME saliencies."""
         with mpl.rc_context(drcp):
             dictionary = {}
-            for feature_importance in (
-                explanations.saliency_map().get(output_name).getPerFeatureImportance()
-            ):
+            for feature_importance in explanations._saliency_map_cached[
+                output_name
+            ].getPerFeatureImportance():
                 dictionary[
                     feature_importance.getFeature().name
                 ] = feature_importance.getScore()
@@ -59,7 +63,7 @@ class LimeViz(VisualizationResults):
                     "feature": str(pfi.getFeature().getName()),
                     "saliency": pfi.getScore(),
                 }
-                for pfi in explanations.saliency_map()[
+                for pfi in explanations._saliency_map_cached[
                     output_name
                 ].getPerFeatureImportance()
             ]
@@ -109,7 +113,4 @@ class LimeViz(VisualizationResults):
         return bokeh_plot
 
     def _get_bokeh_plot_dict(self, explanations):
-        return {
-            output_name: self._get_bokeh_plot(explanations, output_name)
-            for output_name in explanations.saliency_map().keys()
-        }
+        return LazyBokehPlots(self, explanations)
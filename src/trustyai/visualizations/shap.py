@@ -1,7 +1,9 @@
 """Visualizations.shap module"""
 # pylint: disable = import-error, consider-using-f-string, too-few-public-methods, missing-final-newline
+# pylint: disable = protected-access
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from matplotlib.collections import LineCollection
 from bokeh.models import ColumnDataSource, HoverTool
 from bokeh.plotting import figure
 import pandas as pd
@@ -15,108 +17,131 @@ from trustyai.utils._visualisation import (
     output_html,
     feature_html,
 )
-from trustyai.visualizations.visualization_results import VisualizationResults
+from trustyai.visualizations.visualization_results import (
+    VisualizationResults,
+    LazyBokehPlots,
+)
+
+
+def _candlestick_geometry(shap_values, fnull, centre_offset=0.0, overlap=0.0):
+    """Return the bottom and top of each candlestick bar, whether each bar is positive, and the
+    x and y coordinates of the connectors joining each bar's bottom to the previous bar and its
+    top to the next. Bar `i` is centred at `i + centre_offset`, and each connector runs from
+    halfway between two bars to `overlap` past the centre of the bar it is drawn on."""
+    shap_values = np.asarray(shap_values, dtype=np.float64)
+    edges = np.cumsum(np.concatenate(([fnull], shap_values)))
+    bottoms, tops = edges[:-1], edges[1:]
+
+    centres = np.arange(len(shap_values)) + centre_offset
+    connector_xs = np.concatenate(
+        (
+            np.column_stack((centres[1:] - 0.5, centres[1:] + overlap)),
+            np.column_stack((centres[:-1] - overlap, centres[:-1] + 0.5)),
+        )
+    )
+    connector_ys = np.repeat(np.concatenate((bottoms[1:], tops[:-1])), 2).reshape(-1, 2)
+    return bottoms, tops, shap_values >= 0, connector_xs, connector_ys
 
 
 class SHAPViz(VisualizationResults):
     """Visualizes SHAP results."""
 
-    def _matplotlib_plot(
+    def _matplotlib_plot(  # pylint: disable=too-many-locals
         self, explanations, output_name=None, block=True, call_show=True
     ) -> None:
         """Visualize the SHAP explanation of each output as a set of candlestick plots,
         one per output."""
         with mpl.rc_context(drcp):
-            shap_values = [
-                pfi.getScore()
-                for pfi in explanations.saliency_map()[
-                    output_name
-                ].getPerFeatureImportance()[:-1]
-            ]
-            feature_names = [
-                str(pfi.getFeature().getName())
-                for pfi in explanations.saliency_map()[
-                    output_name
-                ].getPerFeatureImportance()[:-1]
-            ]
-            fnull = explanations.get_fnull()[output_name]
-            prediction = fnull + sum(shap_values)
+            feature_names, _, shap_values, _, fnull = explanations._extract(output_name)
+            prediction = fnull + shap_values.sum()
 
             if call_show:
                 plt.figure()
-            pos = fnull
-            for j, shap_value in enumerate(shap_values):
-                color = (
-                    ds["negative_primary_colour"]
-                    if shap_value < 0
-                    else ds["positive_primary_colour"]
+            axes = plt.gca()
+            width = 0.9
+            bottoms, _, positive, connector_xs, connector_ys = _candlestick_geometry(
+                shap_values, fnull, overlap=width / 2 * 0.99
+            )
+            colors = np.where(
+                positive, ds["positive_primary_colour"], ds["negative_primary_colour"]
+            )
+            axes.bar(
+                np.arange(len(shap_values)),
+                height=shap_values,
+                bottom=bottoms,
+                color=colors,
+                width=width,
+            )
+            axes.add_collection(
+                LineCollection(
+                    np.stack((connector_xs, connector_ys), axis=-1),
+                    colors=np.concatenate((colors[1:], colors[:-1])),
                 )
-                width = 0.9
-                if j > 0:
-                    plt.plot([j - 0.5, j + width / 2 * 0.99], [pos, pos], color=color)
-                plt.bar(j, height=shap_value, bottom=pos, color=color, width=width)
-                pos += shap_values[j]
-
-                if j != len(shap_values) - 1:
-                    plt.plot([j - width / 2 * 0.99, j + 0.5], [pos, pos], color=color)
+            )
 
-            plt.axhline(
+            axes.axhline(
                 fnull,
                 color="#444444",
                 linestyle="--",
                 zorder=0,
                 label="Background Value",
             )
-            plt.axhline(prediction, color="#444444", zorder=0, label="Prediction")
-            plt.legend()
-
-            ticksize = np.diff(plt.gca().get_yticks())[0]
-            plt.ylim(
-                plt.gca().get_ylim()[0] - ticksize / 2,
-                plt.gca().get_ylim()[1] + ticksize / 2,
+            axes.axhline(prediction, color="#444444", zorder=0, label="Prediction")
+            axes.legend()
+
+            ticksize = np.diff(axes.get_yticks())[0]
+            ylim = axes.get_ylim()
+            axes.set_ylim(ylim[0] - ticksize / 2, ylim[1] + ticksize / 2)
+            axes.set_xticks(np.arange(len(feature_names)), feature_names)
+            axes.set_ylabel(
+                explanations._saliency_map_cached[output_name].getOutput().getName()
             )
-            plt.xticks(np.arange(len(feature_names)), feature_names)
-            plt.ylabel(explanations.saliency_map()[output_name].getOutput().getName())
-            plt.xlabel("Feature SHAP Value")
-            plt.title(f"SHAP: Feature Contributions to {output_name}")
+            axes.set_xlabel("Feature SHAP Value")
+            axes.set_title(f"SHAP: Feature Contributions to {output_name}")
             if call_show:
                 plt.show(block=block)
 
-    def _get_bokeh_plot(self, explanations, output_name):
-        fnull = explanations.get_fnull()[output_name]
+    def _get_bokeh_plot(  # pylint: disable=too-many-locals
+        self, explanations, output_name
+    ):
+        feature_names, _, saliencies, _, fnull = explanations._extract(output_name)
 
-        # create dataframe of plot values
-        data_source = pd.DataFrame(
-            [
-                {
-                    "feature": str(pfi.getFeature().getName()),
-                    "saliency": pfi.getScore(),
-                }
-                for pfi in explanations.saliency_map()[
-                    output_name
-                ].getPerFeatureImportance()[:-1]
-            ]
+        prediction = fnull + saliencies.sum()
+        bottoms, tops, positive, connector_xs, connector_ys = _candlestick_geometry(
+            saliencies, fnull, centre_offset=0.5
         )
-        prediction = fnull + data_source["saliency"].sum()
 
-        data_source["color"] = data_source["saliency"].apply(
-            lambda x: ds["positive_primary_colour"]
-            if x >= 0
-            else ds["negative_primary_colour"]
-        )
-        data_source["color_faded"] = data_source["saliency"].apply(
-            lambda x: ds["positive_primary_colour_faded"]
-            if x >= 0
-            else ds["negative_primary_colour_faded"]
-        )
-        data_source["index"] = data_source.index
-        data_source["saliency_text"] = data_source["saliency"].apply(
-            lambda x: (bold_red_html if x <= 0 else bold_green_html)("{:.2f}".format(x))
+        # html templates for the hover text, formatted once per bar
+        positive_text = bold_green_html("{:.2f}")
+        negative_text = bold_red_html("{:.2f}")
+
+        # create dataframe of plot values
+        data_source = pd.DataFrame(
+            {
+                "feature": feature_names,
+                "saliency": saliencies,
+                "color": np.where(
+                    positive,
+                    ds["positive_primary_colour"],
+                    ds["negative_primary_colour"],
+                ),
+                "color_faded": np.where(
+                    positive,
+                    ds["positive_primary_colour_faded"],
+                    ds["negative_primary_colour_faded"],
+                ),
+                "index": np.arange(len(feature_names)),
+                "saliency_text": [
+                    template.format(x)
+                    for template, x in zip(
+                        np.where(saliencies <= 0, negative_text, positive_text),
+                        saliencies,
+                    )
+                ],
+                "bottom": bottoms,
+                "top": tops,
+            }
         )
-        data_source["bottom"] = pd.Series(
-            [fnull] + data_source["saliency"].iloc[0:-1].tolist()
-        ).cumsum()
-        data_source["top"] = data_source["bottom"] + data_source["saliency"]
 
         # create hovertools
         htool_fnull = HoverTool(
@@ -186,25 +211,12 @@ class SHAPViz(VisualizationResults):
         )
 
         # create candlestick plot lines
-        bokeh_plot.line(
-            x=[0.5, 1],
-            y=data_source.iloc[0]["top"],
-            color=data_source.iloc[0]["color"],
+        colors = data_source["color"].to_numpy()
+        bokeh_plot.multi_line(
+            xs=connector_xs.tolist(),
+            ys=connector_ys.tolist(),
+            line_color=np.concatenate((colors[1:], colors[:-1])).tolist(),
         )
-        for i in range(1, len(data_source)):
-            # bar left line
-            bokeh_plot.line(
-                x=[i, i + 0.5],
-                y=data_source.iloc[i]["bottom"],
-                color=data_source.iloc[i]["color"],
-            )
-            # bar right line
-            if i != len(data_source) - 1:
-                bokeh_plot.line(
-                    x=[i + 0.5, i + 1],
-                    y=data_source.iloc[i]["top"],
-                    color=data_source.iloc[i]["color"],
-                )
 
         # create candles
         bokeh_plot.vbar(
@@ -221,7 +233,4 @@ class SHAPViz(VisualizationResults):
         return bokeh_plot
 
     def _get_bokeh_plot_dict(self, explanations):
-        return {
-            decision: self._get_bokeh_plot(explanations, decision)
-            for decision in explanations.saliency_map().keys()
-        }
+        return LazyBokehPlots(self, explanations)
@@ -1,6 +1,8 @@
 """Generic class for Visualization results"""
 # pylint: disable = import-error, too-few-public-methods, line-too-long, missing-final-newline
+# pylint: disable = protected-access
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Dict
 
 import bokeh.models
@@ -23,7 +25,30 @@ class VisualizationResults(ABC):
     def _get_bokeh_plot_dict(self, explanations) -> Dict[str, bokeh.models.Plot]:
         """Get a dictionary containing visualizations of the saliencies of all outputs,
         keyed by output name"""
-        return {
-            output_name: self._get_bokeh_plot(explanations, output_name)
-            for output_name in explanations.saliency_map().keys()
-        }
+        return LazyBokehPlots(self, explanations)
+
+
+class LazyBokehPlots(Mapping):
+    """Read-only mapping of output names to bokeh plots. Each plot is only built the first
+    time it is accessed, so asking for a single output does not build the plots of every
+    other output. Wrap in :code:`dict(...)` to build all of them eagerly."""
+
+    def __init__(self, visualization: VisualizationResults, explanations):
+        self._visualization = visualization
+        self._explanations = explanations
+        self._plots = {}
+
+    def __getitem__(self, output_name: str) -> bokeh.models.Plot:
+        if output_name not in self._plots:
+            if output_name not in self._explanations._saliency_map_cached:
+                raise KeyError(output_name)
+            self._plots[output_name] = self._visualization._get_bokeh_plot(
+                self._explanations, output_name
+            )
+        return self._plots[output_name]
+
+    def __iter__(self):
+        return iter(self._explanations._saliency_map_cached)
+
+    def __len__(self):
+        return len(self._explanations._saliency_map_cached)
@@ -14,7 +14,7 @@ from trustyai.utils.data_conversions import (
     many_inputs_convert,
     many_outputs_convert, to_trusty_dataframe
 )
-from org.kie.trustyai.explainability.model import Type
+from org.kie.trustyai.explainability.model import Type, PredictionInput
 
 from trustyai.utils import text
 
@@ -45,6 +45,8 @@ def test_numeric_domain_tuple():
     assert jdomain.getLowerBound() == 0.0
     assert jdomain.getUpperBound() == 1000.0
 
+    assert feature_domain((-10, 10)) is feature_domain((-10, 10))
+
 
 def test_categorical_numeric_domain_list():
     """Test create numeric domain from list"""
@@ -314,6 +316,23 @@ def test_many_inputs_conversion2():
         assert ta_numpy1[i].equals(ta_df[i])
 
 
+def test_many_inputs_conversion_float():
+    """Test that float arrays and dataframes convert to the same PredInputs as building
+    each feature by hand"""
+    numpy1 = np.random.rand(10, 5)
+    df = pd.DataFrame(numpy1, columns=["input-{}".format(i) for i in range(5)])
+
+    ta_numpy1 = many_inputs_convert(numpy1)
+    ta_df = many_inputs_convert(df)
+
+    for i in range(10):
+        expected = PredictionInput(
+            [feature("input-{}".format(j), "number", numpy1[i, j]) for j in range(5)]
+        )
+        assert ta_numpy1[i].equals(expected)
+        assert ta_df[i].equals(expected)
+
+
 def test_many_inputs_conversion_domained():
     """Test many input conversions to many PredInputs with domains"""
     n_feats = 5
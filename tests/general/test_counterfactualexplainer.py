@@ -2,6 +2,7 @@
 """Test suite for counterfactual explanations"""
 import math
 import random
+from functools import lru_cache
 
 import pandas as pd
 import pytest
@@ -47,6 +48,27 @@ def test_non_empty_input():
         assert entity is not None
 
 
+def test_counterfactual_timeout_isolation():
+    """A timeout given to one explainer does not constrain another with the same steps"""
+    goal = [output(name="inside", dtype="bool", value=True, score=0.0)]
+    center = 500.0
+    epsilon = 10.0
+    model = TestModels.getSumThresholdModel(center, epsilon)
+    features = [
+        feature(name=f"f-num{i + 1}", value=10.0, dtype="number", domain=(0.0, 1000.0)) for i in range(4)
+    ]
+
+    timed = CounterfactualExplainer(steps=10000)
+    untimed = CounterfactualExplainer(steps=10000)
+    assert timed._explainer is not untimed._explainer
+
+    timed.explain(inputs=features, goal=goal, model=model, timeout=5)
+    assert untimed._solver_config.getTerminationConfig().getSpentLimit() is None
+
+    result = untimed.explain(inputs=features, goal=goal, model=model)
+    assert result._result.isValid()
+
+
 def test_counterfactual_match():
     """Test if there's a valid counterfactual"""
     goal = [output(name="inside", dtype="bool", value=True, score=0.0)]
@@ -189,8 +211,32 @@ def test_counterfactual_match_python_model():
                                                                                                         rel=3)
 
 
-def counterfactual_plot(block):
-    """Test if there's a valid counterfactual with a Python model"""
+def test_counterfactual_as_arrays():
+    """Test that the array and record views match the dataframe view"""
+    goal = np.array([[1000]])
+    features = [
+        feature(name=f"f-num{i + 1}", value=10.0, dtype="number", domain=(0.0, 1000.0)) for i in range(5)
+    ]
+    explainer = CounterfactualExplainer(steps=1000)
+    model = Model(sum_skip_model, dataframe_input=False, output_names=['sum-but-5'])
+    result = explainer.explain(inputs=features, goal=goal, model=model)
+
+    df = result.as_dataframe()
+    for column, array in zip(df.columns, result.as_arrays()):
+        assert list(array) == list(df[column])
+    assert result.as_records() == df.to_dict("records")
+
+    # views are copies, so modifying one does not change the result
+    proposed = result.proposed_features_array
+    proposed[0][0] = -1.0
+    assert result.proposed_features_array[0][0] != -1.0
+    result.as_html().data["features"] = "modified"
+    assert list(result.as_dataframe()["features"]) == list(df["features"])
+
+
+@lru_cache(maxsize=None)
+def counterfactual_plot_result():
+    """Counterfactual result shared by the plot tests, so the search only runs once"""
     GOAL_VALUE = 1000
     goal = np.array([[GOAL_VALUE]])
     n_features = 5
@@ -202,12 +248,15 @@ def counterfactual_plot(block):
 
     model = Model(sum_skip_model, dataframe_input=False, output_names=['sum-but-5'])
 
-    result = explainer.explain(
+    return explainer.explain(
         inputs=features,
         goal=goal,
         model=model)
 
-    result.plot(block=block)
+
+def counterfactual_plot(block):
+    """Test if there's a valid counterfactual with a Python model"""
+    counterfactual_plot_result().plot(block=block)
 
 
 @pytest.mark.block_plots
@@ -221,8 +270,8 @@ def test_counterfactual_plot():
 
 def test_counterfactual_v2():
     np.random.seed(0)
-    data = pd.DataFrame(np.random.rand(1, 5))
-    features = [feature(str(k), "number", v, domain=(-10., 10.)) for k, v in data.iloc[0].items()]
+    data = np.random.rand(5)
+    features = [feature(str(k), "number", float(v), domain=(-10., 10.)) for k, v in enumerate(data)]
     model_weights = np.random.rand(5)
     predict_function = lambda x: np.dot(x.values, model_weights)
 
@@ -272,3 +321,52 @@ def test_counterfactual_with_domain_argument_overwrite():
             feature_domains=[feature_domain((-10, 10)) for _ in range(5)],
             model=model
         )
+
+
+def test_counterfactual_explain_async():
+    """Test that concurrent counterfactual searches each find a valid counterfactual"""
+    goal = [output(name="inside", dtype="bool", value=True, score=0.0)]
+    center = 500.0
+    epsilon = 10.0
+    model = TestModels.getSumThresholdModel(center, epsilon)
+    explainer = CounterfactualExplainer(steps=10000)
+
+    futures = []
+    for start in (10.0, 20.0):
+        features = [
+            feature(name=f"f-num{i + 1}", value=start, dtype="number", domain=(0.0, 1000.0)) for i in range(4)
+        ]
+        futures.append(explainer.explain_async(inputs=features, goal=goal, model=model))
+
+    for future in futures:
+        result = future.result()
+        total_sum = sum(entity.as_feature().value.as_number() for entity in result._result.entities)
+        assert center - epsilon <= total_sum <= center + epsilon
+        assert result._result.isValid()
+
+
+@pytest.mark.parametrize("dataframe_input", [False, True])
+def test_counterfactual_explain_async_python_model(dataframe_input):
+    """Test concurrent counterfactual searches on one shared Python model"""
+    GOAL_VALUE = 1000
+    goal = np.array([[GOAL_VALUE]])
+    if dataframe_input:
+        model = Model(lambda x: sum_skip_model(x.to_numpy()), dataframe_input=True, output_names=['sum-but-5'])
+    else:
+        model = Model(sum_skip_model, dataframe_input=False, output_names=['sum-but-5'])
+    provider = model.prediction_provider
+    explainer = CounterfactualExplainer(steps=1000)
+
+    futures = []
+    for timeout in (None, 30):
+        features = [
+            feature(name=f"f-num{i + 1}", value=10.0, dtype="number", domain=(0.0, 1000.0)) for i in range(5)
+        ]
+        futures.append(explainer.explain_async(inputs=features, goal=goal, model=model, timeout=timeout))
+
+    for future in futures:
+        result = future.result()
+        assert sum([entity.as_feature().value.as_number() for entity in result._result.entities]) == approx(
+            GOAL_VALUE, rel=3)
+    # the model's own transmission mode is left untouched by the searches
+    assert model.prediction_provider is provider
@@ -157,3 +157,90 @@ def test_shap_edit_plot():
     plt.ylim(0, 123)
     plt.show()
 
+
+
+def test_shap_candlestick_geometry():
+    """Check the candlestick bars and connectors against the original per-bar drawing"""
+    from trustyai.visualizations.shap import _candlestick_geometry
+
+    shap_values = [1.0, -2.0, 0.0, 0.5]
+    fnull = 3.0
+
+    # bokeh path: bars centred half a unit in, connectors end at the bar centre
+    bottoms, tops, positive, xs, ys = _candlestick_geometry(shap_values, fnull, centre_offset=0.5)
+    assert np.allclose(bottoms, [3.0, 4.0, 2.0, 2.0])
+    assert np.allclose(tops, [4.0, 2.0, 2.0, 2.5])
+    assert positive.tolist() == [True, False, True, True]
+
+    # every bar but the first joins the previous bar at its bottom,
+    # and every bar but the last joins the next bar at its top
+    assert np.allclose(xs, [[1, 1.5], [2, 2.5], [3, 3.5], [0.5, 1], [1.5, 2], [2.5, 3]])
+    assert np.allclose(ys[:, 0], [4.0, 2.0, 2.0, 4.0, 2.0, 2.0])
+    assert np.allclose(ys[:, 1], ys[:, 0])
+
+    # matplotlib path: bars centred on integers, connectors overlapping each bar
+    overlap = 0.9 / 2 * 0.99
+    _, _, _, xs, ys = _candlestick_geometry(shap_values, fnull, overlap=overlap)
+    expected_bottom, expected_top = [], []
+    pos = fnull
+    for j, shap_value in enumerate(shap_values):
+        if j > 0:
+            expected_bottom.append(([j - 0.5, j + overlap], [pos, pos]))
+        pos += shap_value
+        if j != len(shap_values) - 1:
+            expected_top.append(([j - overlap, j + 0.5], [pos, pos]))
+    expected = expected_bottom + expected_top
+    assert np.allclose(xs, [segment_xs for segment_xs, _ in expected])
+    assert np.allclose(ys, [segment_ys for _, segment_ys in expected])
+
+
+def test_shap_explainer_reuse():
+    """Check that Java explainers are reused across calls with the same configuration"""
+    np.random.seed(0)
+    data = np.random.rand(21, 5)
+    model_weights = np.random.rand(5)
+    predict_function = lambda x: np.dot(x, model_weights)
+    model = Model(predict_function, disable_arrow=True)
+
+    shap_explainer = SHAPExplainer(background=data[1:])
+    for _ in range(2):
+        shap_explainer.explain(inputs=data[0], outputs=model(data[0]), model=model)
+    assert len(shap_explainer._explainers) == 1
+
+    explanation = shap_explainer.explain(
+        inputs=data[0], outputs=model(data[0]), model=model, samples=100, batch_size=10
+    )
+    assert len(shap_explainer._explainers) == 2
+    assert len(explanation.as_dataframe()) == 1
+
+
+def test_shap_as_df_cached():
+    """Check that repeated dataframe calls return independent copies of the same result"""
+    np.random.seed(0)
+    data = np.random.rand(21, 5)
+    model_weights = np.random.rand(5)
+    predict_function = lambda x: np.dot(x, model_weights)
+    model = Model(predict_function, disable_arrow=True)
+
+    shap_explainer = SHAPExplainer(background=data[1:])
+    explanation = shap_explainer.explain(inputs=data[0], outputs=model(data[0]), model=model)
+
+    first = explanation.as_dataframe()
+    for df in first.values():
+        df["SHAP Value"] = 0.0
+    for out_name, df in explanation.as_dataframe().items():
+        assert df is not first[out_name]
+        assert not df["SHAP Value"].equals(first[out_name]["SHAP Value"])
+
+
+def test_shap_max_background_samples():
+    """Check that large backgrounds are subsampled to the requested size"""
+    np.random.seed(0)
+    data = np.random.rand(51, 5)
+    model_weights = np.random.rand(5)
+    predict_function = lambda x: np.dot(x, model_weights)
+    model = Model(predict_function, disable_arrow=True)
+
+    shap_explainer = SHAPExplainer(background=data[1:], max_background_samples=10)
+    explanation = shap_explainer.explain(inputs=data[0], outputs=model(data[0]), model=model)
+    assert len(explanation.background) == 10
@@ -22,6 +22,19 @@ def test_random_generation():
         assert row in data
 
 
+def test_random_generation_seed():
+    """Test that the seed passed to the generator is used for sampling"""
+    np.random.seed(0)
+    data = np.random.rand(100, 5)
+    first = prediction_object_to_numpy(BackgroundGenerator(data, seed=42).sample(5))
+    second = prediction_object_to_numpy(BackgroundGenerator(data, seed=42).sample(5))
+    default = prediction_object_to_numpy(BackgroundGenerator(data, seed=0).sample(5))
+
+    assert BackgroundGenerator(data, seed=42).seed == 42
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first, default)
+
+
 def test_kmeans_generation():
     """Test that k-means recovers centroids of well-clustered data"""
 